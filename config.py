@@ -17,9 +17,33 @@ TEMP_DIR = os.path.join(PROJECT_ROOT, "temp")
 # 视频生成任务完成结果（SQLite 持久化）
 VIDEO_GEN_TASK_DB_PATH = os.path.join(PROJECT_ROOT, "db", "video_gen_tasks.sqlite3")
 
+# 素材探测结果缓存（SQLite 持久化，与任务库同目录）：pymediainfo / ffprobe 的结果按文件内容缓存
+MEDIA_PROBE_DB_PATH = os.getenv("MEDIA_PROBE_DB_PATH", os.path.join(PROJECT_ROOT, "db", "media_probe.sqlite3"))
+
+# 是否启用素材探测结果缓存（环境变量 true / false，大小写不敏感）
+MEDIA_PROBE_CACHE_ENABLED = os.getenv("MEDIA_PROBE_CACHE_ENABLED", "true").strip().lower() == "true"
+
 # 视频生成任务：生成视频在 COS 上的可访问保留天数（预签名下载 URL 有效期，环境变量覆盖）
 VIDEO_GEN_RETENTION_DAYS = max(1, int(os.getenv("VIDEO_GEN_RETENTION_DAYS", "7")))
 
+# 草稿内存缓存：最多常驻的草稿数量（环境变量覆盖）
+DRAFT_CACHE_MAX_SIZE = max(1, int(os.getenv("DRAFT_CACHE_MAX_SIZE", "100")))
+
+# 草稿内存缓存：常驻草稿的估算内存总预算（字节，环境变量覆盖，默认 512MB），超出后按最久未使用淘汰
+DRAFT_CACHE_MAX_BYTES = max(1, int(os.getenv("DRAFT_CACHE_MAX_BYTES", str(512 * 1024 * 1024))))
+
+# 草稿写合并窗口（秒，环境变量覆盖）：修改草稿后在窗口内合并多次保存，<=0 时每次修改立即保存
+DRAFT_SAVE_DELAY_SECONDS = float(os.getenv("DRAFT_SAVE_DELAY_SECONDS", "1.0"))
+
+# 草稿操作工作线程数（环境变量覆盖）：草稿的修改与保存在工作线程中执行，同一草稿的操作串行
+DRAFT_EXECUTOR_WORKERS = max(1, int(os.getenv("DRAFT_EXECUTOR_WORKERS", "4")))
+
+# 草稿操作队列上限（环境变量覆盖）：同一草稿排队中与执行中的修改请求达到该数量时，直接拒绝新请求
+DRAFT_MAILBOX_MAX_DEPTH = max(1, int(os.getenv("DRAFT_MAILBOX_MAX_DEPTH", "100")))
+
+# 草稿文件紧凑格式（环境变量 true / false，默认关闭）：启用后草稿json不换行、不缩进，体积更小、保存更快
+DRAFT_COMPACT_JSON = os.getenv("DRAFT_COMPACT_JSON", "false").strip().lower() == "true"
+
 # 剪映草稿的下载路径
 DRAFT_URL = os.getenv("DRAFT_URL", "https://capcut-mate.jcaigc.cn/openapi/capcut-mate/v1/get_draft")
 
@@ -81,3 +105,30 @@ ENABLE_APIKEY = os.getenv("ENABLE_APIKEY", "true").strip().lower() == "true"
 
 # 文件下载大小限制（字节），默认200MB
 DOWNLOAD_FILE_SIZE_LIMIT = int(os.getenv("DOWNLOAD_FILE_SIZE_LIMIT", str(200 * 1024 * 1024)))
+
+# 单次请求内素材并发下载数（环境变量覆盖）：add_* 准备阶段的素材下载并发执行
+DOWNLOAD_CONCURRENCY = max(1, int(os.getenv("DOWNLOAD_CONCURRENCY", "8")))
+
+# 同一主机的并发下载数上限（环境变量覆盖）：进程内所有请求共享，避免对单个源站并发过多
+DOWNLOAD_PER_HOST_LIMIT = max(1, int(os.getenv("DOWNLOAD_PER_HOST_LIMIT", "4")))
+
+# 跨草稿共享的素材缓存（环境变量 true / false，大小写不敏感）：相同 URL 或相同内容的素材只下载一次，以硬链接放入草稿目录
+MEDIA_CACHE_ENABLED = os.getenv("MEDIA_CACHE_ENABLED", "true").strip().lower() == "true"
+
+# 素材缓存目录（环境变量覆盖）
+MEDIA_CACHE_DIR = os.getenv("MEDIA_CACHE_DIR", os.path.join(PROJECT_ROOT, "output", "media_cache"))
+
+# 素材缓存容量上限（字节，环境变量覆盖，默认 10GB），超出后按最久未使用淘汰
+MEDIA_CACHE_MAX_BYTES = max(1, int(os.getenv("MEDIA_CACHE_MAX_BYTES", str(10 * 1024 * 1024 * 1024))))
+
+# 素材缓存重新校验间隔（秒，环境变量覆盖）：超过间隔后用 ETag / Last-Modified 向源站确认文件未变化
+MEDIA_CACHE_REVALIDATE_SECONDS = max(0, int(os.getenv("MEDIA_CACHE_REVALIDATE_SECONDS", "600")))
+
+# 共享 HTTP 连接池（环境变量覆盖）：最多为多少个主机保留 keep-alive 连接池
+HTTP_POOL_HOSTS = max(1, int(os.getenv("HTTP_POOL_HOSTS", "32")))
+
+# 共享 HTTP 连接池（环境变量覆盖）：每个主机最多保留的 keep-alive 连接数，默认与同一主机的并发下载数一致
+HTTP_POOL_PER_HOST = max(1, int(os.getenv("HTTP_POOL_PER_HOST", str(DOWNLOAD_PER_HOST_LIMIT))))
+
+# 主机下载能力缓存有效期（秒，环境变量覆盖）：同一主机的延迟、Range 支持及传输速度在有效期内复用，不再逐个文件探测
+HOST_CAPABILITY_TTL_SECONDS = max(0, int(os.getenv("HOST_CAPABILITY_TTL_SECONDS", "300")))
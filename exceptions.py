@@ -54,6 +54,8 @@ class CustomError(Enum):
     FILTER_GET_FAILED = (2040, "获取滤镜列表失败", "Get filter list failed")
     EFFECT_GET_FAILED = (2041, "获取特效列表失败", "Get effect list failed")
     DRAFT_LOCK_TIMEOUT = (2042, "草稿锁获取超时，同一时间只允许一个操作", "Draft lock acquisition timeout, only one operation allowed at a time")
+    DRAFT_QUEUE_FULL = (2043, "草稿待处理的操作过多，请稍后重试", "Too many pending operations on this draft, please retry later")
+    BATCH_OPERATION_FAILED = (2044, "批量操作失败，草稿未做任何修改", "Batch operation failed, no changes were applied to the draft")
 
     # ===== 系统错误码 (9000-9999) =====
     INTERNAL_SERVER_ERROR = (9998, "系统内部错误", "Internal server error")